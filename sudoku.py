@@ -35,14 +35,27 @@ night_mode = False
 paused = False
 pause_start_time = 0.0  # Time when we entered pause, used to freeze the timer
 
-# Fonts (we'll keep them static in size for simplicity)
+# Fonts are scaled to CELL_SIZE and cached per size (set in set_screen_size)
 pygame.font.init()
-FONT = pygame.font.Font(pygame.font.match_font('arial'), 30)
-TITLE_FONT = pygame.font.Font(pygame.font.match_font('arial'), 48)
-SMALL_FONT = pygame.font.Font(pygame.font.match_font('arial'), 20)  # smaller to fit instructions better
+FONT = None
+TITLE_FONT = None
+SMALL_FONT = None  # smaller to fit instructions better
 
-# Create window (done in set_screen_size)
+# Cell size the original fixed font/button sizes were designed for (600x750 window)
+BASE_CELL_SIZE = 66
+
+# Create window and layout (done in set_screen_size)
 screen = None
+layout = None
+
+# Full-window overlay for pause/game over, only kept while one is showing
+overlay_surface = None
+
+# Resize debouncing: a drag-resize fires many VIDEORESIZE events, so we only
+# remember the latest size and apply it once the window has settled.
+RESIZE_SETTLE_MS = 150
+pending_resize = None
+pending_resize_ticks = 0
 
 
 ################################################################################
@@ -94,12 +107,126 @@ def toggle_night_mode():
 ################################################################################
 # Screen Size Adjustment
 ################################################################################
+_font_cache = {}
+
+def get_fonts(cell_size):
+    """
+    Returns (FONT, TITLE_FONT, SMALL_FONT) scaled to the given cell size.
+    Only the fonts for the current cell size are cached; a new size
+    replaces them so old font handles are released.
+    """
+    if cell_size not in _font_cache:
+        _font_cache.clear()
+        font_path = pygame.font.match_font('arial')
+        scale = cell_size / BASE_CELL_SIZE
+        _font_cache[cell_size] = tuple(
+            pygame.font.Font(font_path, max(8, round(size * scale)))
+            for size in (30, 48, 20)
+        )
+    return _font_cache[cell_size]
+
+def centered_text_pos(font, text, rect):
+    """Returns the top-left position that centers `text` inside `rect`."""
+    text_w, text_h = font.size(text)
+    return (rect.x + (rect.width - text_w) // 2, rect.y + (rect.height - text_h) // 2)
+
+class Layout:
+    """
+    All rects and text positions for one window size.
+    Computed once per size and shared by the draw functions and click handling.
+    """
+
+    def __init__(self, width, height, cell_size):
+        self.width, self.height = width, height
+        self.cell_size = cell_size
+        self.board_size = cell_size * GRID_SIZE
+
+        font, title_font, small_font = get_fonts(cell_size)
+        scale = cell_size / BASE_CELL_SIZE
+
+        def s(n):
+            return round(n * scale)
+
+        def button(cx, y, w, h):
+            return pygame.Rect(cx - s(w) // 2, y, s(w), s(h))
+
+        mid_x, mid_y = width // 2, height // 2
+
+        # Board: grid lines, cell rects, and centered offsets for each digit
+        self.grid_lines = []
+        for i in range(GRID_SIZE + 1):
+            line_width = 4 if i % 3 == 0 else 1
+            pos = i * cell_size
+            self.grid_lines.append(((pos, 0), (pos, self.board_size), line_width))
+            self.grid_lines.append(((0, pos), (self.board_size, pos), line_width))
+        self.cell_rects = [
+            [pygame.Rect(col * cell_size, row * cell_size, cell_size, cell_size)
+             for col in range(GRID_SIZE)]
+            for row in range(GRID_SIZE)
+        ]
+        self.digit_offsets = {}
+        for num in range(1, 10):
+            text_w, text_h = font.size(str(num))
+            self.digit_offsets[num] = ((cell_size - text_w) // 2, (cell_size - text_h) // 2)
+
+        # Bottom UI text (mistakes counter is anchored at its top-right corner)
+        self.timer_pos = (10, height - s(50))
+        self.mistakes_topright = (width - 10, height - s(50))
+
+        # Pause overlay
+        self.paused_title_pos = ((width - title_font.size("Paused")[0]) // 2, mid_y - s(80))
+        self.resume_button = button(mid_x, mid_y - s(10), 140, 50)
+        self.resume_text_pos = centered_text_pos(font, "Resume", self.resume_button)
+        self.menu_button = button(mid_x, mid_y + s(60), 140, 50)
+        self.menu_text_pos = centered_text_pos(font, "Main Menu", self.menu_button)
+
+        # Game over overlay
+        self.game_over_pos = ((width - title_font.size("GAME OVER!")[0]) // 2, mid_y - s(60))
+        self.restart_button = button(mid_x, mid_y + s(10), 120, 50)
+        self.restart_text_pos = centered_text_pos(font, "Restart", self.restart_button)
+
+        # Start menu
+        self.title_pos = ((width - title_font.size("Sudoku Puzzle Game")[0]) // 2, height // 4)
+        self.play_button = button(mid_x, mid_y, 150, 50)
+        self.play_text_pos = centered_text_pos(font, "Play", self.play_button)
+        self.instructions_button = button(mid_x, mid_y + s(70), 150, 50)
+        self.instructions_text_pos = centered_text_pos(font, "Instructions", self.instructions_button)
+        self.night_hint_pos = (
+            (width - small_font.size("Press 'N' for Night Mode")[0]) // 2,
+            self.instructions_button.bottom + s(60),
+        )
+
+        # Instructions screen
+        self.header_pos = ((width - title_font.size("Instructions")[0]) // 2, s(30))
+        self.back_button = button(mid_x, height - s(80), 100, 40)
+        self.back_text_pos = centered_text_pos(font, "Back", self.back_button)
+        # Box sits between the header and the Back button so neither is covered
+        box_top = self.header_pos[1] + title_font.get_height() + s(10)
+        box_bottom = self.back_button.top - s(10)
+        self.instructions_box = pygame.Rect(
+            s(50), box_top, max(0, width - 2 * s(50)), max(0, box_bottom - box_top)
+        )
+        self.instructions_line_spacing = max(1, s(26))  # roughly SMALL_FONT size + a bit
+
+    def cell_at(self, pos):
+        """Returns the (row, col) under a screen position, or None if outside the board."""
+        x, y = pos
+        if 0 <= x < self.board_size and 0 <= y < self.board_size:
+            return (y // self.cell_size, x // self.cell_size)
+        return None
+
 def set_screen_size(new_width, new_height):
     """
     Updates the global WIDTH, HEIGHT, and CELL_SIZE.
-    Re-initializes the display mode in RESIZABLE mode.
+    Re-initializes the display mode in RESIZABLE mode and switches to the
+    fonts and layout for the new size. Only the current layout is kept.
     """
-    global WIDTH, HEIGHT, CELL_SIZE, screen
+    global WIDTH, HEIGHT, CELL_SIZE, screen, layout, overlay_surface
+    global FONT, TITLE_FONT, SMALL_FONT
+
+    # Nothing to do if the window already has this size
+    if screen is not None and (new_width, new_height) == (WIDTH, HEIGHT):
+        return
 
     # Update global dimensions
     WIDTH, HEIGHT = new_width, new_height
@@ -112,7 +239,32 @@ def set_screen_size(new_width, new_height):
     puzzle_area_height = HEIGHT - 150
     cell_size_w = WIDTH // GRID_SIZE
     cell_size_h = puzzle_area_height // GRID_SIZE
-    CELL_SIZE = min(cell_size_w, cell_size_h)
+    CELL_SIZE = max(1, min(cell_size_w, cell_size_h))
+
+    FONT, TITLE_FONT, SMALL_FONT = get_fonts(CELL_SIZE)
+    layout = Layout(WIDTH, HEIGHT, CELL_SIZE)
+    # The old overlay no longer matches the window; recreated on demand
+    overlay_surface = None
+
+def queue_resize(new_width, new_height):
+    """Remembers the latest requested window size; applied by apply_pending_resize()."""
+    global pending_resize, pending_resize_ticks
+    pending_resize = (new_width, new_height)
+    pending_resize_ticks = pygame.time.get_ticks()
+
+def apply_pending_resize():
+    """
+    Applies a queued resize once no new VIDEORESIZE event has arrived for
+    RESIZE_SETTLE_MS, so the display is only recreated after a drag settles.
+    """
+    global pending_resize
+    if pending_resize is None:
+        return
+    if pygame.time.get_ticks() - pending_resize_ticks < RESIZE_SETTLE_MS:
+        return
+    new_width, new_height = pending_resize
+    pending_resize = None
+    set_screen_size(new_width, new_height)
 
 
 ################################################################################
@@ -188,23 +340,9 @@ def draw_board():
     colors = get_colors(night_mode)
     screen.fill(colors["main_bg"])
 
-    puzzle_draw_height = CELL_SIZE * GRID_SIZE
-
     # Draw sudoku grid lines
-    for i in range(GRID_SIZE + 1):
-        line_width = 4 if i % 3 == 0 else 1
-        pygame.draw.line(
-            screen, colors["line"],
-            (i * CELL_SIZE, 0),
-            (i * CELL_SIZE, puzzle_draw_height),
-            line_width
-        )
-        pygame.draw.line(
-            screen, colors["line"],
-            (0, i * CELL_SIZE),
-            (CELL_SIZE * GRID_SIZE, i * CELL_SIZE),
-            line_width
-        )
+    for start_pos, end_pos, line_width in layout.grid_lines:
+        pygame.draw.line(screen, colors["line"], start_pos, end_pos, line_width)
 
     # Draw numbers in each cell
     for row in range(GRID_SIZE):
@@ -214,18 +352,14 @@ def draw_board():
                 text_col = colors["negative_text"] if val < 0 else colors["text"]
                 num = abs(val)
                 text_surf = FONT.render(str(num), True, text_col)
-                x_pos = col * CELL_SIZE + (CELL_SIZE - text_surf.get_width()) // 2
-                y_pos = row * CELL_SIZE + (CELL_SIZE - text_surf.get_height()) // 2
-                screen.blit(text_surf, (x_pos, y_pos))
+                cell_rect = layout.cell_rects[row][col]
+                dx, dy = layout.digit_offsets[num]
+                screen.blit(text_surf, (cell_rect.x + dx, cell_rect.y + dy))
 
     # Highlight selected cell
     if selected_cell:
         sel_row, sel_col = selected_cell
-        pygame.draw.rect(
-            screen, colors["highlight"],
-            (sel_col * CELL_SIZE, sel_row * CELL_SIZE, CELL_SIZE, CELL_SIZE),
-            3
-        )
+        pygame.draw.rect(screen, colors["highlight"], layout.cell_rects[sel_row][sel_col], 3)
 
 def draw_ui():
     """Draws the timer, mistakes counter, or pause/game-over overlay if needed."""
@@ -239,12 +373,12 @@ def draw_ui():
 
     # Timer at lower-left
     timer_text = FONT.render(f"Time: {time_elapsed}s", True, colors["text"])
-    screen.blit(timer_text, (10, HEIGHT - 50))
+    screen.blit(timer_text, layout.timer_pos)
 
     # Mistakes at lower-right
     mistakes_color = colors["negative_text"] if mistakes >= 3 else colors["text"]
     mistakes_text = FONT.render(f"Mistakes: {mistakes}/3", True, mistakes_color)
-    screen.blit(mistakes_text, (WIDTH - 180, HEIGHT - 50))
+    screen.blit(mistakes_text, mistakes_text.get_rect(topright=layout.mistakes_topright))
 
     # Pause overlay if paused
     if paused:
@@ -254,59 +388,59 @@ def draw_ui():
     if mistakes >= 3:
         draw_game_over()
 
+    # Release the overlay surface once neither overlay is showing
+    if not paused and mistakes < 3:
+        release_overlay()
+
     pygame.display.flip()
 
+def get_overlay(fill_color):
+    """Returns the full-window overlay surface filled with `fill_color`, creating it if needed."""
+    global overlay_surface
+    if overlay_surface is None:
+        overlay_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    overlay_surface.fill(fill_color)
+    return overlay_surface
+
+def release_overlay():
+    """Drops the overlay surface so it doesn't stay allocated during normal play."""
+    global overlay_surface
+    overlay_surface = None
+
 def draw_pause_overlay():
     """Semi-transparent pause menu with 'Resume' and 'Main Menu' buttons."""
     colors = get_colors(night_mode)
 
-    overlay_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surface.fill((0, 0, 0, 150))  # black w/ alpha
-    screen.blit(overlay_surface, (0, 0))
+    screen.blit(get_overlay((0, 0, 0, 150)), (0, 0))  # black w/ alpha
 
     # "Paused" text
     paused_text_surf = TITLE_FONT.render("Paused", True, colors["title_text"])
-    px = (WIDTH - paused_text_surf.get_width()) // 2
-    py = HEIGHT // 2 - 80
-    screen.blit(paused_text_surf, (px, py))
+    screen.blit(paused_text_surf, layout.paused_title_pos)
 
     # Resume button
-    resume_rect = pygame.Rect(WIDTH // 2 - 70, HEIGHT // 2 - 10, 140, 50)
-    pygame.draw.rect(screen, colors["button_bg"], resume_rect, border_radius=10)
+    pygame.draw.rect(screen, colors["button_bg"], layout.resume_button, border_radius=10)
     resume_text = FONT.render("Resume", True, colors["button_text"])
-    rx = resume_rect.x + (resume_rect.width - resume_text.get_width()) // 2
-    ry = resume_rect.y + (resume_rect.height - resume_text.get_height()) // 2
-    screen.blit(resume_text, (rx, ry))
+    screen.blit(resume_text, layout.resume_text_pos)
 
     # Main Menu button
-    menu_rect = pygame.Rect(WIDTH // 2 - 70, HEIGHT // 2 + 60, 140, 50)
-    pygame.draw.rect(screen, colors["button_bg"], menu_rect, border_radius=10)
+    pygame.draw.rect(screen, colors["button_bg"], layout.menu_button, border_radius=10)
     menu_text = FONT.render("Main Menu", True, colors["button_text"])
-    mx = menu_rect.x + (menu_rect.width - menu_text.get_width()) // 2
-    my = menu_rect.y + (menu_rect.height - menu_text.get_height()) // 2
-    screen.blit(menu_text, (mx, my))
+    screen.blit(menu_text, layout.menu_text_pos)
 
 def draw_game_over():
     """Draws a semi-transparent overlay with 'GAME OVER' and a 'Restart' button."""
     colors = get_colors(night_mode)
 
-    overlay_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay_surface.fill(colors["game_over_overlay"])
-    screen.blit(overlay_surface, (0, 0))
+    screen.blit(get_overlay(colors["game_over_overlay"]), (0, 0))
 
     # "Game Over" text
     game_over_text = TITLE_FONT.render("GAME OVER!", True, colors["negative_text"])
-    go_x = (WIDTH - game_over_text.get_width()) // 2
-    go_y = HEIGHT // 2 - 60
-    screen.blit(game_over_text, (go_x, go_y))
+    screen.blit(game_over_text, layout.game_over_pos)
 
     # Restart button
-    button_rect = pygame.Rect(WIDTH // 2 - 60, HEIGHT // 2 + 10, 120, 50)
-    pygame.draw.rect(screen, colors["button_bg"], button_rect, border_radius=10)
+    pygame.draw.rect(screen, colors["button_bg"], layout.restart_button, border_radius=10)
     restart_text = FONT.render("Restart", True, colors["button_text"])
-    rt_x = button_rect.x + (button_rect.width - restart_text.get_width()) // 2
-    rt_y = button_rect.y + (button_rect.height - restart_text.get_height()) // 2
-    screen.blit(restart_text, (rt_x, rt_y))
+    screen.blit(restart_text, layout.restart_text_pos)
 
 def draw_start_menu():
     """
@@ -317,34 +451,23 @@ def draw_start_menu():
 
     # Title
     title_text = TITLE_FONT.render("Sudoku Puzzle Game", True, colors["title_text"])
-    title_x = (WIDTH - title_text.get_width()) // 2
-    title_y = HEIGHT // 4
-    screen.blit(title_text, (title_x, title_y))
+    screen.blit(title_text, layout.title_pos)
 
     # Play button
-    play_button_rect = pygame.Rect(WIDTH // 2 - 75, HEIGHT // 2, 150, 50)
-    pygame.draw.rect(screen, colors["button_bg"], play_button_rect, border_radius=8)
+    pygame.draw.rect(screen, colors["button_bg"], layout.play_button, border_radius=8)
     play_text = FONT.render("Play", True, colors["button_text"])
-    pt_x = play_button_rect.x + (play_button_rect.width - play_text.get_width()) // 2
-    pt_y = play_button_rect.y + (play_button_rect.height - play_text.get_height()) // 2
-    screen.blit(play_text, (pt_x, pt_y))
+    screen.blit(play_text, layout.play_text_pos)
 
     # Instructions button
-    instr_button_rect = pygame.Rect(WIDTH // 2 - 75, HEIGHT // 2 + 70, 150, 50)
-    pygame.draw.rect(screen, colors["button_bg"], instr_button_rect, border_radius=8)
+    pygame.draw.rect(screen, colors["button_bg"], layout.instructions_button, border_radius=8)
     instr_text = FONT.render("Instructions", True, colors["button_text"])
-    it_x = instr_button_rect.x + (instr_button_rect.width - instr_text.get_width()) // 2
-    it_y = instr_button_rect.y + (instr_button_rect.height - instr_text.get_height()) // 2
-    screen.blit(instr_text, (it_x, it_y))
+    screen.blit(instr_text, layout.instructions_text_pos)
 
     # Night mode hint
     nm_hint_text = SMALL_FONT.render("Press 'N' for Night Mode", True, colors["text"])
-    nm_hint_x = (WIDTH - nm_hint_text.get_width()) // 2
-    nm_hint_y = instr_button_rect.y + instr_button_rect.height + 60
-    screen.blit(nm_hint_text, (nm_hint_x, nm_hint_y))
+    screen.blit(nm_hint_text, layout.night_hint_pos)
 
     pygame.display.flip()
-    return play_button_rect, instr_button_rect
 
 def draw_instructions_window():
     """
@@ -356,12 +479,10 @@ def draw_instructions_window():
 
     # Header
     header_text = TITLE_FONT.render("Instructions", True, colors["title_text"])
-    hx = (WIDTH - header_text.get_width()) // 2
-    hy = 30
-    screen.blit(header_text, (hx, hy))
+    screen.blit(header_text, layout.header_pos)
 
     # We'll draw instructions within a bounding box to avoid going off-screen
-    instructions_box_rect = pygame.Rect(50, 100, WIDTH - 100, HEIGHT - 200)
+    instructions_box_rect = layout.instructions_box
     # Fill background
     instructions_surf = pygame.Surface((instructions_box_rect.width, instructions_box_rect.height))
     instructions_surf.fill(colors["menu_bg"])
@@ -386,28 +507,23 @@ def draw_instructions_window():
 
     # Render lines into instructions_surf with some vertical spacing.
     y_offset = 0
-    line_spacing = 26  # roughly SMALL_FONT size + a bit
     for line in instructions:
         line_surf = SMALL_FONT.render(line, True, colors["text"])
         # If the next line might go off the bottom, we break to avoid overflow
         if y_offset + line_surf.get_height() > instructions_box_rect.height:
             break
         instructions_surf.blit(line_surf, (0, y_offset))
-        y_offset += line_spacing
+        y_offset += layout.instructions_line_spacing
 
     # Blit instructions_surf onto screen
-    screen.blit(instructions_surf, (instructions_box_rect.x, instructions_box_rect.y))
+    screen.blit(instructions_surf, instructions_box_rect.topleft)
 
     # Back button
-    back_button_rect = pygame.Rect(WIDTH // 2 - 50, HEIGHT - 80, 100, 40)
-    pygame.draw.rect(screen, colors["button_bg"], back_button_rect, border_radius=8)
+    pygame.draw.rect(screen, colors["button_bg"], layout.back_button, border_radius=8)
     back_text = FONT.render("Back", True, colors["button_text"])
-    bx = back_button_rect.x + (back_button_rect.width - back_text.get_width()) // 2
-    by = back_button_rect.y + (back_button_rect.height - back_text.get_height()) // 2
-    screen.blit(back_text, (bx, by))
+    screen.blit(back_text, layout.back_text_pos)
 
     pygame.display.flip()
-    return back_button_rect
 
 
 ################################################################################
@@ -580,39 +696,42 @@ def main():
     paused = False
 
     while running:
+        # Recreate the display once a drag-resize has settled
+        apply_pending_resize()
+
         if in_start_menu:
-            play_btn, instr_btn = draw_start_menu()
+            draw_start_menu()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
-                    set_screen_size(event.w, event.h)
+                    queue_resize(event.w, event.h)
                 elif event.type == pygame.KEYDOWN:
                     handle_keydown(event.key)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # left click
-                        if play_btn.collidepoint(event.pos):
+                        if layout.play_button.collidepoint(event.pos):
                             puzzle, solution = generate_puzzle(current_difficulty)
                             mistakes = 0
                             start_time = time.time()
                             selected_cell = None
                             paused = False
                             in_start_menu = False
-                        elif instr_btn.collidepoint(event.pos):
+                        elif layout.instructions_button.collidepoint(event.pos):
                             in_instructions_menu = True
                             in_start_menu = False
 
         elif in_instructions_menu:
-            back_button = draw_instructions_window()
+            draw_instructions_window()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
-                    set_screen_size(event.w, event.h)
+                    queue_resize(event.w, event.h)
                 elif event.type == pygame.KEYDOWN:
                     handle_keydown(event.key)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1 and back_button.collidepoint(event.pos):
+                    if event.button == 1 and layout.back_button.collidepoint(event.pos):
                         in_instructions_menu = False
                         in_start_menu = True
 
@@ -625,33 +744,31 @@ def main():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
-                    set_screen_size(event.w, event.h)
+                    queue_resize(event.w, event.h)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     # If game over, check if "Restart" was clicked
                     if mistakes >= 3:
-                        restart_button_rect = pygame.Rect(WIDTH // 2 - 60, HEIGHT // 2 + 10, 120, 50)
-                        if restart_button_rect.collidepoint(event.pos):
+                        if layout.restart_button.collidepoint(event.pos):
                             restart_game()
                             continue
 
                     # If paused, check if "Resume" or "Main Menu" was clicked
                     if paused:
-                        resume_rect = pygame.Rect(WIDTH // 2 - 70, HEIGHT // 2 - 10, 140, 50)
-                        menu_rect = pygame.Rect(WIDTH // 2 - 70, HEIGHT // 2 + 60, 140, 50)
-                        if resume_rect.collidepoint(event.pos):
+                        if layout.resume_button.collidepoint(event.pos):
                             unpause_game()
-                        elif menu_rect.collidepoint(event.pos):
+                        elif layout.menu_button.collidepoint(event.pos):
                             # Return to main menu
                             in_start_menu = True
                             paused = False
+                            release_overlay()
                         continue
 
                     # If not paused or game-over, handle puzzle cell clicks
                     if mistakes < 3:
-                        x, y = event.pos
                         # Ensure we clicked inside puzzle area
-                        if x < CELL_SIZE * GRID_SIZE and y < CELL_SIZE * GRID_SIZE:
-                            selected_cell = (y // CELL_SIZE, x // CELL_SIZE)
+                        cell = layout.cell_at(event.pos)
+                        if cell is not None:
+                            selected_cell = cell
 
                 elif event.type == pygame.KEYDOWN:
                     handle_keydown(event.key)